@@ -10,14 +10,19 @@ from module.llm_agent import gemini_llm
 from module.prompt_template import (
     extracted_resume,
     compare_cv_from_job_description,
+    stream_compare_cv_from_job_description,
     extract_rubrics_with_llm,
+    CompareResult,
 )
+from module.store import EvaluationStore, EvaluationRecord, hash_bytes, hash_text
+from module.config import settings
 import streamlit as st
 import warnings
 import tempfile
 import os
 import uuid
 import shutil
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
@@ -56,15 +61,54 @@ def save_upload_to_disk(uploaded_file, suffix=".pdf"):
     return st.session_state[key]
 
 
+@st.cache_resource
+def get_evaluation_store() -> EvaluationStore:
+    return EvaluationStore()
+
+
+def render_evaluation(record: EvaluationRecord):
+    st.subheader("Extracted Rubrics Job Description")
+    st.json(record.rubrics.dict())
+    st.subheader("Job Context")
+    st.text(record.job_context)
+    st.subheader("Comparison Result")
+    st.json(record.comparison.dict())
+
+
 def main():
     try:
         st.title("Resume Evaluation with LLM 🧠")
 
         uploaded_file = st.file_uploader("Upload your CV (PDF format)", type=["pdf"])
         job_description = st.text_area("Enter Job Description", height=500)
+        stream_result = st.checkbox("Stream comparison result", value=True)
+        recompute = st.checkbox("Recompute even if a stored result exists")
         button = st.button("Evaluate Resume")
 
         if button and uploaded_file is not None and job_description.strip() != "":
+            preprocessed_job_description = load_job_description(job_description)
+            resume_hash = hash_bytes(uploaded_file.getvalue())
+            job_hash = hash_text(preprocessed_job_description)
+            model = settings.GEMINI_MODEL_LLM
+            # streamed and blocking comparisons use different prompts
+            mode = "stream" if stream_result else "blocking"
+
+            # the store is a best-effort cache; never let it block an evaluation
+            store, stored = None, None
+            try:
+                store = get_evaluation_store()
+                stored = store.get(resume_hash, job_hash, model, mode=mode)
+            except (sqlite3.Error, OSError) as e:
+                st.warning(f"Evaluation store unavailable, recomputing: {e}")
+
+            if stored is not None and not recompute:
+                st.info(
+                    "Loaded stored evaluation from "
+                    f"{stored.created_at:%Y-%m-%d %H:%M} UTC."
+                )
+                render_evaluation(stored)
+                return
+
             # Show a spinner while heavy processing runs
             with st.spinner("Evaluating resume... This can take a few seconds."):
                 # Optional status area for granular updates
@@ -75,9 +119,6 @@ def main():
                 document = load_pdf_document(temp_file_path)
                 candidate_info = extracted_resume(document)
 
-                status.markdown("📋 Preprocessing job description...")
-                preprocessed_job_description = load_job_description(job_description)
-
                 status.markdown("🧩 Splitting job description into chunks...")
                 chunks = split_text_into_chunks(
                     preprocessed_job_description, chunk_size=100, chunk_overlap=10
@@ -105,19 +146,46 @@ def main():
                 st.text(job_context)
 
                 status.markdown("⚖️ Comparing resume against job description...")
-                comparison_result = compare_cv_from_job_description(
-                    candidate_info,
-                    {
-                        "skills": rubrics.skills,
-                        "experiences": rubrics.experiences,
-                        "projects": rubrics.projects,
-                    },
-                    job_context,
-                )
+                rubric = {
+                    "skills": rubrics.skills,
+                    "experiences": rubrics.experiences,
+                    "projects": rubrics.projects,
+                }
+                st.subheader("Comparison Result")
+                result_placeholder = st.empty()
+
+                if stream_result:
+                    for partial in stream_compare_cv_from_job_description(
+                        candidate_info, rubric, job_context
+                    ):
+                        if isinstance(partial, CompareResult):
+                            comparison_result = partial
+                        else:
+                            result_placeholder.json(partial)
+                else:
+                    comparison_result = compare_cv_from_job_description(
+                        candidate_info, rubric, job_context
+                    )
 
                 status.markdown("✅ Evaluation complete.")
-                st.subheader("Comparison Result")
-                st.json(comparison_result.dict())
+                result_placeholder.json(comparison_result.dict())
+
+                if store is not None:
+                    try:
+                        store.add(
+                            EvaluationRecord(
+                                resume_hash=resume_hash,
+                                job_hash=job_hash,
+                                model=model,
+                                mode=mode,
+                                rubrics=rubrics,
+                                job_context=job_context,
+                                comparison=comparison_result,
+                            )
+                        )
+                        store.flush()
+                    except (sqlite3.Error, OSError) as e:
+                        st.warning(f"Could not save evaluation to the store: {e}")
     except Exception as e:
         st.error(f"An error occurred: {e}")
 
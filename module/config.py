@@ -61,6 +61,12 @@ class Config(BaseSettings):
         default="", alias="MISTRAL_LLM_MODEL", description="Mistral LLM model"
     )
 
+    EVALUATION_DB_PATH: str = Field(
+        default="./evaluation_db/evaluations.db",
+        alias="EVALUATION_DB_PATH",
+        description="SQLite file for stored evaluation results",
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
     )
@@ -1,8 +1,11 @@
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.prompts import ChatPromptTemplate
 from module.llm_agent import mistral_llm, gemini_llm
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import from_json
+from typing import Iterator
 import json
+import re
 
 
 class CandidateInfo(BaseModel):
@@ -78,9 +81,19 @@ class CompareResult(BaseModel):
     project_feedback: str = Field(..., description="Feedback on projects criteria")
 
 
-def compare_cv_from_job_description(
-    cv_text: str, rubric: dict, job_context: str
-) -> CompareResult:
+def _compare_messages(
+    cv_text: str, rubric: dict, job_context: str, schema: bool = False
+) -> list[ChatMessage]:
+    # the structured LLM injects the schema itself; raw streaming needs it inline
+    schema_hint = ""
+    if schema:
+        schema_hint = f"""
+    Schema:
+    {json.dumps(CompareResult.model_json_schema())}
+
+    Keys in this order: {", ".join(CompareResult.model_fields)}
+"""
+
     prompt = f"""
     Candidate Info:
     {cv_text}
@@ -90,11 +103,11 @@ def compare_cv_from_job_description(
 
     Job Context:
     {job_context}
-
+{schema_hint}
     Return strict JSON:
     """
 
-    messages = [
+    return [
         ChatMessage(
             role=MessageRole.SYSTEM,
             content="""
@@ -109,6 +122,12 @@ def compare_cv_from_job_description(
         ),
     ]
 
+
+def compare_cv_from_job_description(
+    cv_text: str, rubric: dict, job_context: str
+) -> CompareResult:
+    messages = _compare_messages(cv_text, rubric, job_context)
+
     llm = gemini_llm(temperature=0.0)
     sllm = llm.as_structured_llm(CompareResult)
     output = sllm.chat(messages)
@@ -119,6 +138,60 @@ def compare_cv_from_job_description(
     return output.raw
 
 
+def _parse_partial_json(text: str) -> dict | None:
+    # drop any preamble / ```json fence and parse whatever prefix has arrived
+    start = text.find("{")
+    if start == -1:
+        return None
+    text = re.sub(r"\s*`{1,3}\s*$", "", text[start:])
+    try:
+        parsed = from_json(text, allow_partial="trailing-strings")
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+
+    # a number is only final once a delimiter follows it ("0" may become "0.85")
+    if parsed and text[-1] not in ",}" and not text[-1].isspace():
+        last_key = next(reversed(parsed))
+        last_value = parsed[last_key]
+        if isinstance(last_value, (int, float)) and not isinstance(last_value, bool):
+            del parsed[last_key]
+    return parsed
+
+
+def stream_compare_cv_from_job_description(
+    cv_text: str, rubric: dict, job_context: str
+) -> Iterator[dict | CompareResult]:
+    """Stream the comparison while the LLM generates it.
+
+    Yields partial dicts (keys of CompareResult seen so far) as tokens arrive,
+    then the validated CompareResult as the final item.
+    """
+    messages = _compare_messages(cv_text, rubric, job_context, schema=True)
+
+    llm = gemini_llm(temperature=0.0)
+    text = ""
+    last = None
+    for chunk in llm.stream_chat(messages):
+        text += chunk.delta or ""
+        partial = _parse_partial_json(text)
+        if partial and partial != last:
+            last = partial
+            yield partial
+
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("Failed to parse comparison result from LLM response.")
+
+    try:
+        result = CompareResult.model_validate_json(text[start : end + 1])
+    except ValidationError as e:
+        raise ValueError(f"Failed to parse comparison result from LLM response: {e}")
+
+    yield result
+
+
 class Rubrics(BaseModel):
     skills: float = Field(..., description="Weight for skills criteria range 0-1")
     experiences: float = Field(
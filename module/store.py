@@ -0,0 +1,276 @@
+from module.config import settings
+from module.prompt_template import CompareResult, Rubrics
+from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+import threading
+import hashlib
+import sqlite3
+import csv
+
+# Bump whenever prompts, chunking or retrieval change so stale results are not replayed.
+PIPELINE_VERSION = "1"
+
+_COLUMNS = [
+    "resume_hash",
+    "job_hash",
+    "model",
+    "pipeline_version",
+    "mode",
+    "rubrics",
+    "job_context",
+    "cv_match_score",
+    "cv_feedback",
+    "project_score",
+    "project_feedback",
+    "created_at",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    resume_hash TEXT NOT NULL,
+    job_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    pipeline_version TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    rubrics TEXT NOT NULL,
+    job_context TEXT NOT NULL,
+    cv_match_score REAL NOT NULL,
+    cv_feedback TEXT NOT NULL,
+    project_score REAL NOT NULL,
+    project_feedback TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (resume_hash, job_hash, model, pipeline_version, mode)
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_job ON evaluations (job_hash, cv_match_score);
+CREATE INDEX IF NOT EXISTS idx_evaluations_score ON evaluations (cv_match_score);
+"""
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    return hash_bytes(text.encode("utf-8"))
+
+
+class EvaluationRecord(BaseModel):
+    resume_hash: str = Field(..., description="SHA-256 of the uploaded resume file")
+    job_hash: str = Field(
+        ..., description="SHA-256 of the preprocessed job description"
+    )
+    model: str = Field(..., description="LLM model used for the evaluation")
+    pipeline_version: str = Field(default=PIPELINE_VERSION)
+    mode: str = Field(
+        default="blocking",
+        description="Comparison mode, 'blocking' or 'stream' (different prompts)",
+    )
+    rubrics: Rubrics
+    job_context: str
+    comparison: CompareResult
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_row(self) -> tuple:
+        return (
+            self.resume_hash,
+            self.job_hash,
+            self.model,
+            self.pipeline_version,
+            self.mode,
+            self.rubrics.model_dump_json(),
+            self.job_context,
+            self.comparison.cv_match_score,
+            self.comparison.cv_feedback,
+            self.comparison.project_score,
+            self.comparison.project_feedback,
+            self.created_at.isoformat(),
+        )
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "EvaluationRecord":
+        return cls(
+            resume_hash=row["resume_hash"],
+            job_hash=row["job_hash"],
+            model=row["model"],
+            pipeline_version=row["pipeline_version"],
+            mode=row["mode"],
+            rubrics=Rubrics.model_validate_json(row["rubrics"]),
+            job_context=row["job_context"],
+            comparison=CompareResult(
+                cv_match_score=row["cv_match_score"],
+                cv_feedback=row["cv_feedback"],
+                project_score=row["project_score"],
+                project_feedback=row["project_feedback"],
+            ),
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
+
+class EvaluationStore:
+    """SQLite-backed store of evaluation results.
+
+    Writes are buffered and committed in batches of ``batch_size`` (or on
+    ``flush()`` / leaving the context manager). Reads see pending writes.
+    """
+
+    def __init__(self, path: str | None = None, batch_size: int = 100):
+        self.path = path or settings.EVALUATION_DB_PATH
+        self.batch_size = batch_size
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._pending: dict[tuple, EvaluationRecord] = {}
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "EvaluationStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(self, record: EvaluationRecord) -> None:
+        key = (
+            record.resume_hash,
+            record.job_hash,
+            record.model,
+            record.pipeline_version,
+            record.mode,
+        )
+        with self._lock:
+            self._pending[key] = record
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO evaluations ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                [record.to_row() for record in self._pending.values()],
+            )
+        self._pending.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def get(
+        self,
+        resume_hash: str,
+        job_hash: str,
+        model: str,
+        pipeline_version: str = PIPELINE_VERSION,
+        mode: str = "blocking",
+    ) -> EvaluationRecord | None:
+        key = (resume_hash, job_hash, model, pipeline_version, mode)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            row = self._conn.execute(
+                "SELECT * FROM evaluations WHERE resume_hash = ? AND job_hash = ? "
+                "AND model = ? AND pipeline_version = ? AND mode = ?",
+                key,
+            ).fetchone()
+        return EvaluationRecord.from_row(row) if row else None
+
+    def _select_sql(
+        self,
+        job_hash: str | None = None,
+        min_score: float | None = None,
+        max_score: float | None = None,
+        model: str | None = None,
+        pipeline_version: str | None = None,
+        mode: str | None = None,
+    ) -> tuple[str, list]:
+        clauses, params = [], []
+        if job_hash is not None:
+            clauses.append("job_hash = ?")
+            params.append(job_hash)
+        if min_score is not None:
+            clauses.append("cv_match_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("cv_match_score <= ?")
+            params.append(max_score)
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if pipeline_version is not None:
+            clauses.append("pipeline_version = ?")
+            params.append(pipeline_version)
+        if mode is not None:
+            clauses.append("mode = ?")
+            params.append(mode)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return (
+            f"SELECT {', '.join(_COLUMNS)} FROM evaluations{where} "
+            "ORDER BY cv_match_score DESC",
+            params,
+        )
+
+    def _iter_batches(self, batch_size: int, **filters) -> Iterator[list[sqlite3.Row]]:
+        sql, params = self._select_sql(**filters)
+        self.flush()
+        # the shared connection is serialized by self._lock; long-running reads
+        # get their own read-only connection so they never hold it
+        uri = Path(self.path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.execute(sql, params)
+            while rows := cursor.fetchmany(batch_size):
+                yield rows
+        finally:
+            conn.close()
+
+    def query(self, batch_size: int = 1000, **filters) -> Iterator[EvaluationRecord]:
+        """Yield records filtered by job_hash, min_score/max_score, model,
+        pipeline_version or mode, best cv_match_score first."""
+        for rows in self._iter_batches(batch_size, **filters):
+            for row in rows:
+                yield EvaluationRecord.from_row(row)
+
+    def export_csv(self, path: str, batch_size: int = 1000, **filters) -> int:
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(_COLUMNS)
+            for rows in self._iter_batches(batch_size, **filters):
+                writer.writerows(tuple(row) for row in rows)
+                count += len(rows)
+        return count
+
+    def export_parquet(self, path: str, batch_size: int = 10000, **filters) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires `pyarrow`.") from e
+
+        schema = pa.schema(
+            [
+                (name, pa.float64() if name.endswith("_score") else pa.string())
+                for name in _COLUMNS
+            ]
+        )
+        count = 0
+        with pq.ParquetWriter(path, schema) as writer:
+            for rows in self._iter_batches(batch_size, **filters):
+                columns = {name: [row[name] for row in rows] for name in _COLUMNS}
+                writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+                count += len(rows)
+        return count
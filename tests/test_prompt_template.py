@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+
+from module import prompt_template
+from module.prompt_template import (
+    CompareResult,
+    _parse_partial_json,
+    stream_compare_cv_from_job_description,
+)
+
+
+class FakeLLM:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def stream_chat(self, messages):
+        for chunk in self.chunks:
+            yield SimpleNamespace(delta=chunk)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    def install(chunks):
+        monkeypatch.setattr(
+            prompt_template, "gemini_llm", lambda **kwargs: FakeLLM(chunks)
+        )
+
+    return install
+
+
+def stream():
+    return list(stream_compare_cv_from_job_description("cv", {"skills": 1.0}, "ctx"))
+
+
+def test_parse_partial_json_skips_leading_fence():
+    text = '```json\n{"cv_match_score": 0.5, "cv_feedback": "ok"'
+    assert _parse_partial_json(text) == {"cv_match_score": 0.5, "cv_feedback": "ok"}
+
+
+def test_parse_partial_json_strips_trailing_fence():
+    assert _parse_partial_json('{"cv_match_score": 0.5}\n```') == {
+        "cv_match_score": 0.5
+    }
+
+
+def test_parse_partial_json_keeps_truncated_string():
+    assert _parse_partial_json('{"cv_feedback": "goo') == {"cv_feedback": "goo"}
+
+
+def test_parse_partial_json_holds_back_truncated_number():
+    assert _parse_partial_json('{"cv_match_score": 0') == {}
+    assert _parse_partial_json('{"cv_feedback": "ok", "project_score": 7') == {
+        "cv_feedback": "ok"
+    }
+    assert _parse_partial_json('{"cv_match_score": 0.85,') == {"cv_match_score": 0.85}
+
+
+def test_parse_partial_json_without_object():
+    assert _parse_partial_json("Sure, here is the result") is None
+
+
+def test_stream_yields_growing_partials_then_result(fake_llm):
+    fake_llm(
+        [
+            '```json\n{"cv_match_score": 0',
+            '.85, "cv_feedback": "Strong',
+            ' backend fit", "project_score": 7',
+            '.5, "project_feedback": "Good"}',
+            "\n```",
+        ]
+    )
+    items = stream()
+
+    *partials, result = items
+    assert partials
+    assert all(isinstance(p, dict) for p in partials)
+    for prev, curr in zip(partials, partials[1:]):
+        for key, value in prev.items():
+            assert key in curr
+            if isinstance(value, str):
+                assert curr[key].startswith(value)
+            else:
+                assert curr[key] == value
+    assert all(p.get("cv_match_score", 0.85) == 0.85 for p in partials)
+    assert all(p.get("project_score", 7.5) == 7.5 for p in partials)
+
+    assert result == CompareResult(
+        cv_match_score=0.85,
+        cv_feedback="Strong backend fit",
+        project_score=7.5,
+        project_feedback="Good",
+    )
+
+
+def test_stream_truncated_output_raises(fake_llm):
+    fake_llm(['{"cv_match_score": 0.85, "cv_feedback": "Strong', " backend fit"])
+
+    with pytest.raises(ValueError):
+        stream()
@@ -0,0 +1,128 @@
+import csv
+
+import pytest
+
+from module.prompt_template import CompareResult, Rubrics
+from module.store import EvaluationRecord, EvaluationStore
+
+
+def make_record(
+    resume_hash="r1", job_hash="j1", score=0.5, pipeline_version="1", mode="blocking"
+):
+    return EvaluationRecord(
+        resume_hash=resume_hash,
+        job_hash=job_hash,
+        model="test-model",
+        pipeline_version=pipeline_version,
+        mode=mode,
+        rubrics=Rubrics(skills=0.5, experiences=0.3, projects=0.2),
+        job_context="python backend engineer",
+        comparison=CompareResult(
+            cv_match_score=score,
+            cv_feedback="good fit",
+            project_score=7.0,
+            project_feedback="solid projects",
+        ),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with EvaluationStore(path=str(tmp_path / "evaluations.db"), batch_size=2) as s:
+        yield s
+
+
+def count_rows(store):
+    with store._lock:
+        return store._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+
+def test_get_reads_pending_records_before_flush(store):
+    store.add(make_record())
+
+    assert count_rows(store) == 0
+    record = store.get("r1", "j1", "test-model", "1")
+    assert record is not None
+    assert record.comparison.cv_match_score == 0.5
+
+
+def test_add_flushes_when_batch_is_full(store):
+    store.add(make_record(resume_hash="r1"))
+    store.add(make_record(resume_hash="r2"))
+
+    assert count_rows(store) == 2
+
+
+def test_flush_round_trips_record(store):
+    original = make_record()
+    store.add(original)
+    store.flush()
+
+    record = store.get("r1", "j1", "test-model", "1")
+    assert record == original
+
+
+def test_same_key_is_replaced_and_pipeline_version_is_part_of_key(store):
+    store.add(make_record(score=0.2))
+    store.flush()
+    store.add(make_record(score=0.9))
+    store.add(make_record(score=0.4, pipeline_version="2"))
+    store.flush()
+
+    assert count_rows(store) == 2
+    assert store.get("r1", "j1", "test-model", "1").comparison.cv_match_score == 0.9
+    assert store.get("r1", "j1", "test-model", "2").comparison.cv_match_score == 0.4
+    assert store.get("r1", "j1", "test-model", "3") is None
+
+
+def test_mode_is_part_of_key(store):
+    store.add(make_record(score=0.2, mode="blocking"))
+    store.add(make_record(score=0.7, mode="stream"))
+    store.flush()
+
+    assert count_rows(store) == 2
+    assert store.get("r1", "j1", "test-model", "1").comparison.cv_match_score == 0.2
+    record = store.get("r1", "j1", "test-model", "1", mode="stream")
+    assert record.comparison.cv_match_score == 0.7
+    assert [r.mode for r in store.query(mode="stream")] == ["stream"]
+
+
+def test_query_filters_by_job_and_score(store):
+    store.add(make_record(resume_hash="r1", job_hash="j1", score=0.9))
+    store.add(make_record(resume_hash="r2", job_hash="j1", score=0.3))
+    store.add(make_record(resume_hash="r3", job_hash="j2", score=0.8))
+
+    results = list(store.query(job_hash="j1", min_score=0.5))
+    assert [r.resume_hash for r in results] == ["r1"]
+
+    results = list(store.query(min_score=0.5))
+    assert [r.resume_hash for r in results] == ["r1", "r3"]
+
+    results = list(store.query(max_score=0.5))
+    assert [r.resume_hash for r in results] == ["r2"]
+
+
+def test_export_csv_streams_all_matching_rows(store, tmp_path):
+    for i in range(5):
+        store.add(make_record(resume_hash=f"r{i}", score=i / 10))
+
+    path = tmp_path / "out.csv"
+    assert store.export_csv(str(path), batch_size=2, min_score=0.2) == 3
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3
+    assert {row["resume_hash"] for row in rows} == {"r2", "r3", "r4"}
+
+
+def test_export_parquet_streams_all_matching_rows(store, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    for i in range(5):
+        store.add(make_record(resume_hash=f"r{i}", score=i / 10))
+
+    path = tmp_path / "out.parquet"
+    assert store.export_parquet(str(path), batch_size=2) == 5
+
+    table = pq.read_table(path)
+    assert table.num_rows == 5
+    assert table.column("cv_match_score").to_pylist() == [0.4, 0.3, 0.2, 0.1, 0.0]